@@ -1,53 +1,28 @@
 #!/usr/bin/env python3
 import argparse
 import sys
-import json
-import requests
-import os
 from pathlib import Path
-from typing import Dict, Optional, Union, List, Set
-import colorama
+from typing import List, Optional
 from colorama import Fore, Style
-from datetime import datetime
-
-class CodeSummarizer:
-    def __init__(self):
-        """Initialize the CodeSummarizer with Ollama endpoint configuration"""
-        self.ollama_endpoint = "http://localhost:11434/api/generate"
-        self.model = "codellama:latest "
-        # Common code file extensions
-        self.code_extensions = {
-            '.py', '.js', '.java', '.cpp', '.c', '.h', '.cs', '.php',
-             '.ts','.html'
-        }
-        colorama.init()
-
-    def is_code_file(self, file_path: Path) -> bool:
-        """
-        Check if the file is a recognized code file.
-        
-        Args:
-            file_path (Path): Path to the file
-            
-        Returns:
-            bool: True if it's a code file, False otherwise
-        """
-        return file_path.suffix.lower() in self.code_extensions
+from summarizer_core import SummarizerCore
+from ollama_client import DEFAULT_MODEL
 
-    def _generate_prompt(self, code: str, file_path: Path) -> str:
-        """
-        Generate a structured prompt for code analysis.
-        
-        Args:
-            code (str): The source code to analyze
-            file_path (Path): Path to the file for context
-            
-        Returns:
-            str: Formatted prompt for the model
-        """
-        return f"""Please analyze this {file_path.suffix[1:]} code file and provide a detailed technical summary including:
+class CodeSummarizer(SummarizerCore):
+    """Standalone text-report summarizer built on the shared pipeline.
+
+    Differs from CodeAnalyzer in its prompt, extension set, and the
+    separator-framed plain-text formatting written to codeSummary.txt.
+    """
+
+    # One request per file keeps the sectioned output predictable
+    BATCH_TOKEN_BUDGET = None
+
+    TIMEOUT = 120.0
+
+    # Identical across requests so Ollama's prompt cache reuses the
+    # prefilled KV for this prefix on every file
+    SYSTEM_PROMPT = """You are an expert programmer that writes simple, concise code and explanations. Analyze each code file you are given and provide a detailed technical summary including:
 
-'You are an expert programmer that writes simple, concise code and explanations'
 1. **Overall Purpose**: Explain the purpose of this code in 1-2 sentences.
 2. **Main Components**: Describe the key classes, functions, and modules. Highlight their roles with brief explanations.
 3. **Code Highlights**: Include  relevant code snippets to demonstrate key logic, algorithms, or patterns.
@@ -55,97 +30,29 @@ class CodeSummarizer:
 5. **Technical Insights**: Point out any notable algorithms, design patterns, or advanced techniques used.
 6. **Improvement Suggestions**: Suggest improvements or optimizations if applicable.
 
-Make sure to avoid repeating the same information. Structure the response clearly using the sections and numbering above.
+Make sure to avoid repeating the same information. Structure the response clearly using the sections and numbering above."""
 
-Here is the code to analyze:
+    # Common code file extensions; class-level so lookups skip the instance dict
+    code_extensions = frozenset({
+        '.py', '.js', '.java', '.cpp', '.c', '.h', '.cs', '.php',
+        '.ts', '.html'
+    })
 
-{code}
-"""
-
-    def _call_ollama(self, prompt: str) -> Optional[str]:
-        """
-        Make an API call to Ollama for text generation.
-        """
-        try:
-            response = requests.post(
-                self.ollama_endpoint,
-                json={
-                    "model": self.model,
-                    "prompt": prompt,
-                    "stream": False
-                },
-                timeout=120
-            )
-            response.raise_for_status()
-            return response.json().get("response")
-        except requests.exceptions.RequestException as e:
-            print(f"{Fore.RED}Error communicating with Ollama: {str(e)}{Style.RESET_ALL}", 
-                  file=sys.stderr)
-            return None
-        except json.JSONDecodeError:
-            print(f"{Fore.RED}Error parsing Ollama response{Style.RESET_ALL}", 
-                  file=sys.stderr)
-            return None
-
-    def process_file(self, file_path: Path, relative_path: str) -> Optional[str]:
-        """
-        Process a single code file and generate its summary.
-        
-        Args:
-            file_path (Path): Absolute path to the code file
-            relative_path (str): Relative path for display purposes
-            
-        Returns:
-            Optional[str]: Generated summary or None if processing failed
-        """
-        try:
-            if not file_path.exists():
-                print(f"{Fore.RED}Error: File {file_path} does not exist{Style.RESET_ALL}", 
-                      file=sys.stderr)
-                return None
-
-            # Skip files larger than 100KB to avoid overwhelming the model
-            if file_path.stat().st_size > 100 * 1024:
-                print(f"{Fore.YELLOW}Skipping {relative_path} (file too large){Style.RESET_ALL}")
-                return None
-
-            # Try different encodings for Windows compatibility
-            encodings = ['utf-8', 'utf-8-sig', 'latin-1', 'cp1252']
-            code_content = None
-            
-            for encoding in encodings:
-                try:
-                    with open(file_path, 'r', encoding=encoding) as f:
-                        code_content = f.read()
-                    break
-                except UnicodeDecodeError:
-                    continue
-            
-            if code_content is None:
-                print(f"{Fore.RED}Error: Unable to read {relative_path} with supported encodings{Style.RESET_ALL}", 
-                      file=sys.stderr)
-                return None
-
-            prompt = self._generate_prompt(code_content, file_path)
-            summary = self._call_ollama(prompt)
-            
-            if summary:
-                return self._format_output(relative_path, summary)
-            return None
-
-        except Exception as e:
-            print(f"{Fore.RED}Error processing {relative_path}: {str(e)}{Style.RESET_ALL}", 
-                  file=sys.stderr)
-            return None
-
-    def _format_output(self, filepath: str, summary: str) -> str:
+    def _format_output(self, filepath: str, summary: str, colored: bool = False) -> str:
         """
         Format the summary output with clear section separation.
+
+        The plain (default) variant is written to disk as-is; pass
+        colored=True only when printing to a terminal.
         """
         separator = "=" * 80
+        if colored:
+            header = f"{Fore.GREEN}Code Analysis for: {filepath}{Style.RESET_ALL}"
+        else:
+            header = f"Code Analysis for: {filepath}"
         return f"""
 {separator}
-{Fore.GREEN}Code Analysis for: {filepath}{Style.RESET_ALL}
+{header}
 {separator}
 
 {summary}
@@ -153,37 +60,59 @@ Here is the code to analyze:
 {separator}
 """
 
-    def process_directory(self, directory_path: Path) -> List[tuple[str, str]]:
+    def format_summary(self, relative_path: str, summary: str) -> str:
+        return self._format_output(relative_path, summary)
+
+    def format_duplicate(self, relative_path: str, canonical: str,
+                         canonical_summary: str) -> str:
+        return self._format_output(
+            relative_path, f"Same content as {canonical} - see its summary.")
+
+    def process_files(self, files, on_summary=None) -> List[tuple[str, str]]:
+        """
+        Process an explicit list of code files.
+
+        Args:
+            files (List[tuple[Path, str]]): (absolute path, relative path) pairs
+            on_summary: Optional callable(relative_path, summary) invoked as
+                each summary completes, enabling streamed output
+
+        Returns:
+            List[tuple[str, str]]: List of (relative_path, summary) tuples
+        """
+        summaries, _stats = super().process_files(files, on_summary)
+        return summaries
+
+    def process_directory(self, directory_path: Path,
+                          on_summary=None) -> List[tuple[str, str]]:
         """
         Recursively process all code files in a directory and its subdirectories.
-        
+
         Args:
             directory_path (Path): Path to the directory to process
-            
+            on_summary: Optional callable(relative_path, summary) invoked as
+                each summary completes
+
         Returns:
             List[tuple[str, str]]: List of (relative_path, summary) tuples
         """
-        summaries = []
-        total_files = sum(1 for p in directory_path.rglob('*') if self.is_code_file(p))
-        processed_files = 0
-
-        print(f"{Fore.CYAN}Found {total_files} code files to process{Style.RESET_ALL}")
-
-        for file_path in directory_path.rglob('*'):
-            if self.is_code_file(file_path):
-                processed_files += 1
-                relative_path = str(file_path.relative_to(directory_path))
-                print(f"{Fore.YELLOW}Processing ({processed_files}/{total_files}): {relative_path}{Style.RESET_ALL}")
-                
-                summary = self.process_file(file_path, relative_path)
-                if summary:
-                    summaries.append((relative_path, summary))
+        # One walk collects the list; the progress total is a byproduct,
+        # not a second traversal
+        files = list(self._iter_code_files(directory_path))
 
-        return summaries
+        print(f"{Fore.CYAN}Found {len(files)} code files to process{Style.RESET_ALL}")
+
+        return self.process_files(files, on_summary)
 
 def main():
-    parser = argparse.ArgumentParser(description='Analyze and summarize code files in a directory using Llama2')
+    parser = argparse.ArgumentParser(description='Analyze and summarize code files in a directory using a local Ollama model')
     parser.add_argument('directory', help='Directory containing code files to analyze')
+    parser.add_argument('--concurrency', type=int, default=4,
+                        help='Maximum number of concurrent Ollama requests (default: 4)')
+    parser.add_argument('--model', default=None,
+                        help=f'Ollama model to use (default: $CODESUM_MODEL or {DEFAULT_MODEL})')
+    parser.add_argument('--max-tokens-per-chunk', type=int, default=3000,
+                        help='Token budget per chunk when splitting oversized files (default: 3000)')
     args = parser.parse_args()
 
     directory_path = Path(args.directory).resolve()
@@ -195,33 +124,43 @@ def main():
     current_dir=Path.cwd()/"codeSummary.txt"
     output_file =current_dir
 
-    summarizer = CodeSummarizer()
+    summarizer = CodeSummarizer(max_concurrency=args.concurrency, model=args.model,
+                                max_tokens_per_chunk=args.max_tokens_per_chunk)
     print(f"{Fore.CYAN}Starting code analysis in: {directory_path}{Style.RESET_ALL}")
-    
-    summaries = summarizer.process_directory(directory_path)
-    
-    if summaries:
-        try:
-            # Create a table of contents
+
+    files = list(summarizer._iter_code_files(directory_path))
+    print(f"{Fore.CYAN}Found {len(files)} code files to process{Style.RESET_ALL}")
+
+    if not files:
+        print(f"{Fore.YELLOW}No code files were found{Style.RESET_ALL}")
+        return
+
+    try:
+        # Stream each summary to disk as it completes instead of holding
+        # the whole report in memory; partial output survives a crash
+        with open(output_file, 'w', encoding='utf-8') as f:
+            # Table of contents comes from the file list, known upfront
             toc = ["Table of Contents", "=" * 80]
-            for filepath, _ in summaries:
-                toc.append(f"- {filepath}")
+            for _, relative_path in files:
+                toc.append(f"- {relative_path}")
             toc.extend(["", "=" * 80, ""])
+            f.write('\n'.join(toc))
+
+            def write_summary(relative_path: str, summary: str) -> None:
+                # Summaries are formatted without color codes, so no
+                # post-hoc stripping passes are needed here
+                f.write(summary)
+                f.flush()
 
-            # Write table of contents and summaries
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write('\n'.join(toc))
-                for _, summary in summaries:
-                    # Remove color codes for file output
-                    clean_summary = summary.replace(Fore.GREEN, '').replace(Fore.YELLOW, '').replace(Style.RESET_ALL, '')
-                    f.write(clean_summary)
+            summaries = summarizer.process_files(files, on_summary=write_summary)
 
+        if summaries:
             print(f"{Fore.GREEN}\nAnalysis complete! Summary saved to: {output_file}{Style.RESET_ALL}")
             print(f"Processed {len(summaries)} files")
-        except Exception as e:
-            print(f"{Fore.RED}Error saving summary: {str(e)}{Style.RESET_ALL}", file=sys.stderr)
-    else:
-        print(f"{Fore.YELLOW}No code files were successfully processed{Style.RESET_ALL}")
+        else:
+            print(f"{Fore.YELLOW}No code files were successfully processed{Style.RESET_ALL}")
+    except Exception as e:
+        print(f"{Fore.RED}Error saving summary: {str(e)}{Style.RESET_ALL}", file=sys.stderr)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,169 @@
+import ast
+import hashlib
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional
+from colorama import Fore, Style
+
+# Vendored/generated directories pruned during traversal
+SKIP_DIRS = frozenset({
+    '.git', 'node_modules', '__pycache__', '.venv', 'venv', 'dist', 'build',
+    '.mypy_cache', '.pytest_cache', 'target', '.idea', '.vscode'
+})
+
+@lru_cache(maxsize=4096)
+def suffix_lower(name: str) -> str:
+    """Lower-cased extension of a file name ('' when there is none).
+
+    Cached because repos repeat the same few names (__init__.py,
+    index.js, ...) thousands of times.
+    """
+    dot = name.rfind('.')
+    return name[dot:].lower() if dot > 0 else ''
+
+def iter_code_files(root: Path, extensions: frozenset):
+    """Yield (path, relative_path) for every matching file under root.
+
+    A single os.scandir pass reuses the directory entries' cached type
+    information instead of stat-ing every entry the way rglob does, and
+    prunes vendored directories before descending into them.
+    """
+    stack = [str(root)]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in SKIP_DIRS:
+                            stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        if suffix_lower(entry.name) in extensions:
+                            path = Path(entry.path)
+                            yield path, str(path.relative_to(root))
+        except OSError:
+            continue
+
+def read_source(file_path: Path, relative_path: str) -> Optional[str]:
+    """Read a source file with one open/fstat/read, then decode with fallbacks."""
+    try:
+        fd = os.open(file_path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+        try:
+            # fstat on the open descriptor avoids a separate stat and the
+            # stat/open race; the size gives one exact-length read
+            size = os.fstat(fd).st_size
+            data = os.read(fd, size)
+        finally:
+            os.close(fd)
+    except FileNotFoundError:
+        print(f"{Fore.RED}Error: File {file_path} does not exist{Style.RESET_ALL}")
+        return None
+    except OSError as e:
+        # Permission denied, I/O errors, over-long paths, ... -- every
+        # failure here degrades to a printed error, never an exception
+        print(f"{Fore.RED}Error reading {relative_path}: {str(e)}{Style.RESET_ALL}")
+        return None
+
+    # A NUL byte near the start means binary, not source
+    if b'\x00' in data[:4096]:
+        print(f"{Fore.YELLOW}Skipping {relative_path} (binary file){Style.RESET_ALL}")
+        return None
+
+    # Decode in place with Windows-compatible fallbacks
+    for encoding in ('utf-8', 'utf-8-sig', 'latin-1', 'cp1252'):
+        try:
+            return data.decode(encoding)
+        except UnicodeDecodeError:
+            continue
+
+    print(f"{Fore.RED}Error: Unable to read {relative_path} with supported encodings{Style.RESET_ALL}")
+    return None
+
+def split_python(code: str, budget_chars: int) -> Optional[List[str]]:
+    """Split Python source on top-level statement boundaries, or None if unparsable."""
+    try:
+        tree = ast.parse(code)
+    except SyntaxError:
+        return None
+
+    lines = code.splitlines(keepends=True)
+    chunks = []
+    current: List[str] = []
+    current_size = 0
+    previous_end = 0
+
+    for node in tree.body:
+        segment = lines[previous_end:node.end_lineno]
+        previous_end = node.end_lineno
+        segment_size = sum(len(line) for line in segment)
+
+        if current and current_size + segment_size > budget_chars:
+            chunks.append(''.join(current))
+            current = []
+            current_size = 0
+
+        current.append(''.join(segment))
+        current_size += segment_size
+
+    current.append(''.join(lines[previous_end:]))
+    chunks.append(''.join(current))
+    return chunks
+
+def split_windows(code: str, budget_chars: int) -> List[str]:
+    """Split source into windows, preferring to break where braces balance."""
+    chunks = []
+    current: List[str] = []
+    current_size = 0
+    depth = 0
+
+    for line in code.splitlines(keepends=True):
+        current.append(line)
+        current_size += len(line)
+        depth += line.count('{') - line.count('}')
+        # Cut at balanced braces once over budget; force a cut at 2x
+        if current_size >= budget_chars and (depth <= 0 or current_size >= budget_chars * 2):
+            chunks.append(''.join(current))
+            current = []
+            current_size = 0
+
+    if current:
+        chunks.append(''.join(current))
+    return chunks
+
+def split_code(code: str, suffix: str, max_tokens: int) -> List[str]:
+    """Split oversized source into chunks under the per-chunk token budget."""
+    budget_chars = max_tokens * 4
+    if suffix == '.py':
+        chunks = split_python(code, budget_chars)
+        if chunks is not None:
+            return chunks
+    return split_windows(code, budget_chars)
+
+def deduplicate(files: List[tuple]):
+    """Map byte-identical files onto one canonical entry each.
+
+    Returns (unique_files, assignments) where assignments[i] is the
+    index into unique_files for files[i] plus the canonical relative
+    path when files[i] is a duplicate (None otherwise).
+    """
+    seen: Dict[str, int] = {}
+    unique_files: List[tuple] = []
+    assignments: List[tuple] = []
+
+    for file_path, relative_path in files:
+        try:
+            digest = hashlib.blake2b(file_path.read_bytes(), digest_size=16).hexdigest()
+        except OSError:
+            digest = None
+
+        if digest is not None and digest in seen:
+            unique_index = seen[digest]
+            assignments.append((unique_index, unique_files[unique_index][1]))
+        else:
+            if digest is not None:
+                seen[digest] = len(unique_files)
+            assignments.append((len(unique_files), None))
+            unique_files.append((file_path, relative_path))
+
+    return unique_files, assignments
@@ -0,0 +1,65 @@
+import hashlib
+import os
+import sqlite3
+import time
+from pathlib import Path
+from typing import Optional
+
+class DiskCache:
+    """Persistent content-addressed cache for LLM responses, backed by SQLite."""
+
+    DEFAULT_EXPIRE = 7 * 86400  # one week
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        """Open (or create) the cache database under ~/.cache/codesummarizer."""
+        if cache_dir is None:
+            cache_dir = Path.home() / '.cache' / 'codesummarizer'
+        cache_dir = Path(cache_dir).expanduser()
+        os.makedirs(cache_dir, exist_ok=True)
+
+        self._conn = sqlite3.connect(cache_dir / 'responses.db', check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+        )
+        # Expired rows are only skipped on get, so sweep them here or the
+        # database grows without bound across runs
+        self._conn.execute(
+            "DELETE FROM responses WHERE expires_at < ?", (time.time(),)
+        )
+        self._conn.commit()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(model: str, prompt: str) -> str:
+        """Derive a stable cache key from the model name and full prompt.
+
+        The prompt embeds the file contents, so editing a file changes
+        the key and invalidates its cached summary automatically.
+        """
+        return hashlib.sha256(f"{model}\0{prompt}".encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for key, or None on miss/expiry."""
+        row = self._conn.execute(
+            "SELECT value, expires_at FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+
+        if row is not None and row[1] > time.time():
+            self.hits += 1
+            return row[0]
+
+        self.misses += 1
+        return None
+
+    def set(self, key: str, value: str, expire: float = DEFAULT_EXPIRE) -> None:
+        """Store a response under key with a time-to-live in seconds."""
+        self._conn.execute(
+            "INSERT OR REPLACE INTO responses (key, value, expires_at) VALUES (?, ?, ?)",
+            (key, value, time.time() + expire)
+        )
+        self._conn.commit()
+
+    def close(self) -> None:
+        self._conn.close()
@@ -1,28 +1,58 @@
 import argparse
+import functools
 import sys
 from pathlib import Path
 from datetime import datetime
 import colorama
 from colorama import Fore, Style
-from model_handler import CodeAnalyzer
+from model_handler import CodeAnalyzer, DEFAULT_MODEL
 from pdf_generator import PDFGenerator
 import os
 
+@functools.lru_cache(maxsize=1)
 def get_downloads_path() -> Path:
-    """Get the path to the user's Downloads directory"""
+    """Get the path to the user's Downloads directory (resolved once per run)"""
     if os.name == 'nt':  # Windows
-        import winreg
-        sub_key = r'SOFTWARE\Microsoft\Windows\CurrentVersion\Explorer\Shell Folders'
-        downloads_guid = '{374DE290-123F-4565-9164-39C4925E467B}'
-        with winreg.OpenKey(winreg.HKEY_CURRENT_USER, sub_key) as key:
-            location = winreg.QueryValueEx(key, downloads_guid)[0]
-        return Path(location)
-    else:  # Linux/Unix/MacOS
-        return Path.home() / 'Downloads'
+        try:
+            import ctypes
+
+            # FOLDERID_Downloads {374DE290-123F-4565-9164-39C4925E467B};
+            # SHGetKnownFolderPath is the documented API and avoids the
+            # registry query the old implementation performed
+            class GUID(ctypes.Structure):
+                _fields_ = [
+                    ("Data1", ctypes.c_uint32),
+                    ("Data2", ctypes.c_uint16),
+                    ("Data3", ctypes.c_uint16),
+                    ("Data4", ctypes.c_ubyte * 8),
+                ]
+
+            folder_id = GUID(
+                0x374DE290, 0x123F, 0x4565,
+                (ctypes.c_ubyte * 8)(0x91, 0x64, 0x39, 0xC4, 0x92, 0x5E, 0x46, 0x7B)
+            )
+            path_ptr = ctypes.c_wchar_p()
+            result = ctypes.windll.shell32.SHGetKnownFolderPath(
+                ctypes.byref(folder_id), 0, None, ctypes.byref(path_ptr))
+            if result == 0:
+                try:
+                    return Path(path_ptr.value)
+                finally:
+                    ctypes.windll.ole32.CoTaskMemFree(path_ptr)
+        except (OSError, AttributeError):
+            pass
+    # Linux/Unix/MacOS, or any Windows API failure
+    return Path.home() / 'Downloads'
 
 def main():
-    parser = argparse.ArgumentParser(description='Analyze and summarize code files in a directory using Llama2')
+    parser = argparse.ArgumentParser(description='Analyze and summarize code files in a directory using a local Ollama model')
     parser.add_argument('directory', help='Directory containing code files to analyze')
+    parser.add_argument('--concurrency', type=int, default=4,
+                        help='Maximum number of concurrent Ollama requests (default: 4)')
+    parser.add_argument('--model', default=None,
+                        help=f'Ollama model to use (default: $CODESUM_MODEL or {DEFAULT_MODEL})')
+    parser.add_argument('--max-tokens-per-chunk', type=int, default=3000,
+                        help='Token budget per chunk when splitting oversized files (default: 3000)')
     args = parser.parse_args()
 
     directory_path = Path(args.directory).resolve()
@@ -35,7 +65,8 @@ def main():
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     pdf_output = downloads_path / f"code_summary_{timestamp}.pdf"
 
-    analyzer = CodeAnalyzer()
+    analyzer = CodeAnalyzer(max_concurrency=args.concurrency, model=args.model,
+                            max_tokens_per_chunk=args.max_tokens_per_chunk)
     pdf_generator = PDFGenerator()
 
     print(f"{Fore.CYAN}Starting code analysis in: {directory_path}{Style.RESET_ALL}")
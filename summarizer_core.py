@@ -0,0 +1,331 @@
+import asyncio
+import re
+import sys
+import httpx
+from pathlib import Path
+from typing import Dict, List, Optional
+import colorama
+from colorama import Fore, Style
+import file_reader
+from ollama_client import OllamaClient
+
+class SummarizerCore:
+    """Shared pipeline behind CodeAnalyzer and CodeSummarizer.
+
+    Walks the tree once, deduplicates identical contents, fans out over a
+    bounded async pool against one OllamaClient, chunks oversized files,
+    and optionally batches small files into combined prompts. Subclasses
+    plug in their system prompt, extension set, and output formatting.
+    """
+
+    # Rough token estimate is len(code) // 4; batches stay under this budget
+    # so batched prompts fit the model's 4K context window. None disables
+    # batching (one request per file).
+    BATCH_TOKEN_BUDGET: Optional[int] = 3000
+
+    # HTTP timeout for the shared client, in seconds
+    TIMEOUT = 150.0
+
+    # Identical across requests so Ollama's prompt cache reuses the
+    # prefilled KV for this prefix on every file
+    SYSTEM_PROMPT = """You are an expert code analyst. For each code file you are given, provide a detailed technical summary including:
+
+1. Overall Purpose: Briefly explain what this code does
+2. Main Components: Describe the key classes, functions, or modules
+3. Implementation Details: Notable algorithms, patterns, or techniques used
+4. Dependencies: List any external libraries or systems required
+5. Technical Highlights: Any interesting or important technical aspects
+
+Structure your response in clear sections using the numbers above. When given several files separated by "### FILE <number>:" markers, begin each file's summary with a line reading exactly "### SUMMARY <number>:"."""
+
+    # Common code file extensions; class-level so lookups skip the instance dict
+    code_extensions = frozenset({
+        '.py', '.js', '.java', '.cpp', '.c', '.h', '.cs', '.php',
+        '.rb', '.go', '.rs', '.ts', '.html', '.css'
+    })
+
+    def __init__(self, max_concurrency: int = 4, model: Optional[str] = None,
+                 max_tokens_per_chunk: int = 3000):
+        """Initialize the shared pipeline with Ollama endpoint configuration"""
+        self.ollama = OllamaClient(model=model, timeout=self.TIMEOUT)
+        self.cache = self.ollama.cache
+        self.max_concurrency = max_concurrency
+        self.max_tokens_per_chunk = max_tokens_per_chunk
+        # Color handling is only useful on a real terminal
+        if sys.stdout.isatty():
+            colorama.init()
+
+    @property
+    def model(self) -> str:
+        return self.ollama.model
+
+    def is_code_file(self, file_path: Path) -> bool:
+        """Check if the file is a recognized code file."""
+        return file_reader.suffix_lower(file_path.name) in self.code_extensions
+
+    def _iter_code_files(self, root: Path):
+        """Yield (path, relative_path) for every code file under root."""
+        return file_reader.iter_code_files(root, self.code_extensions)
+
+    # -- formatting hooks ---------------------------------------------------
+
+    def format_summary(self, relative_path: str, summary: str) -> str:
+        """Post-process one finished summary; subclasses may wrap it."""
+        return summary
+
+    def format_duplicate(self, relative_path: str, canonical: str,
+                         canonical_summary: str) -> str:
+        """Render the entry for a file whose content matched canonical."""
+        return f"Same content as {canonical}.\n\n{canonical_summary}"
+
+    # -- prompts ------------------------------------------------------------
+
+    def _generate_prompt(self, code: str, file_path: Path) -> tuple[str, str]:
+        """Generate the (system, user) message pair for one file."""
+        return self.SYSTEM_PROMPT, f"File: {file_path.name}\n\n{code}"
+
+    def _generate_batch_prompt(self, batch: List[tuple[str, str]]) -> tuple[str, str]:
+        """Generate the (system, user) pair covering several files with FILE markers."""
+        parts = [
+            f"### FILE {i}: {relative_path}\n{code}\n### END FILE {i}\n"
+            for i, (relative_path, code) in enumerate(batch, 1)
+        ]
+        return self.SYSTEM_PROMPT, '\n'.join(parts)
+
+    # -- per-file path ------------------------------------------------------
+
+    async def _summarize_chunks(self, client: httpx.AsyncClient, code: str,
+                                file_path: Path, relative_path: str) -> Optional[str]:
+        """Summarize an oversized file chunk-by-chunk, then merge the partials."""
+        chunks = file_reader.split_code(code, file_path.suffix.lower(),
+                                        self.max_tokens_per_chunk)
+        print(f"{Fore.YELLOW}Splitting {relative_path} into {len(chunks)} chunks{Style.RESET_ALL}")
+
+        partials = []
+        for i, chunk in enumerate(chunks, 1):
+            user = f"File: {file_path.name} (part {i} of {len(chunks)})\n\n{chunk}"
+            partial = await self.ollama.generate(client, self.SYSTEM_PROMPT, user)
+            if partial:
+                partials.append(partial)
+
+        if not partials:
+            return None
+        if len(partials) == 1:
+            return partials[0]
+
+        merge_user = (
+            f"The following are partial summaries of consecutive sections of {file_path.name}. "
+            "Merge them into one coherent summary of the whole file, keeping the numbered "
+            "section structure and dropping repeated points.\n\n"
+            + "\n\n---\n\n".join(partials)
+        )
+        # A merged summary of many chunks runs longer than a single-file
+        # one; double the completion cap so the merge is not cut short
+        merged = await self.ollama.generate(
+            client, self.SYSTEM_PROMPT, merge_user,
+            num_predict=OllamaClient.MODEL_OPTIONS["num_predict"] * 2)
+        return merged or "\n\n".join(partials)
+
+    async def process_file(self, client: httpx.AsyncClient, file_path: Path,
+                           relative_path: str) -> Optional[str]:
+        """Process a single code file and generate its summary."""
+        try:
+            # File reads are blocking; keep them off the event loop
+            code_content = await asyncio.to_thread(
+                file_reader.read_source, file_path, relative_path)
+            if code_content is None:
+                return None
+
+            # Oversized files are chunked and merged rather than skipped
+            if len(code_content) // 4 > self.max_tokens_per_chunk:
+                return await self._summarize_chunks(client, code_content, file_path, relative_path)
+
+            system, user = self._generate_prompt(code_content, file_path)
+            return await self.ollama.generate(client, system, user)
+
+        except Exception as e:
+            print(f"{Fore.RED}Error processing {relative_path}: {str(e)}{Style.RESET_ALL}")
+            return None
+
+    # -- batching -----------------------------------------------------------
+
+    def _batch_files(self, files: List[tuple[Path, str]]) -> List[List[tuple[Path, str]]]:
+        """Group files into batches whose combined size fits the token budget."""
+        if not self.BATCH_TOKEN_BUDGET:
+            return [[entry] for entry in files]
+
+        budget_bytes = self.BATCH_TOKEN_BUDGET * 4
+        batches = []
+        current = []
+        current_size = 0
+
+        for file_path, relative_path in files:
+            try:
+                size = file_path.stat().st_size
+            except OSError:
+                # Emit a real singleton batch so the failure goes through
+                # process_file, which reports the error per file
+                if current:
+                    batches.append(current)
+                    current = []
+                    current_size = 0
+                batches.append([(file_path, relative_path)])
+                continue
+
+            if current and current_size + size > budget_bytes:
+                batches.append(current)
+                current = []
+                current_size = 0
+
+            current.append((file_path, relative_path))
+            current_size += size
+
+        if current:
+            batches.append(current)
+        return batches
+
+    _BATCH_SUMMARY = re.compile(r'### SUMMARY (\d+):')
+
+    def _split_batch_response(self, response: str, count: int) -> Optional[List[str]]:
+        """Split a batched completion into per-file summaries, or None on failure."""
+        parts = self._BATCH_SUMMARY.split(response)
+        summaries: List[Optional[str]] = [None] * count
+
+        for index_str, text in zip(parts[1::2], parts[2::2]):
+            i = int(index_str) - 1
+            if 0 <= i < count:
+                summaries[i] = text.strip()
+
+        if any(s is None for s in summaries):
+            return None
+        return summaries
+
+    async def _process_batch(self, client: httpx.AsyncClient,
+                             batch: List[tuple[Path, str]]) -> List[Optional[str]]:
+        """Summarize a batch with one Ollama call, falling back to per-file mode."""
+        if len(batch) == 1:
+            file_path, relative_path = batch[0]
+            return [await self.process_file(client, file_path, relative_path)]
+
+        contents = [
+            await asyncio.to_thread(file_reader.read_source, file_path, relative_path)
+            for file_path, relative_path in batch
+        ]
+        readable = [
+            (relative_path, code)
+            for (file_path, relative_path), code in zip(batch, contents)
+            if code is not None
+        ]
+        results: List[Optional[str]] = [None] * len(batch)
+        if not readable:
+            return results
+
+        system, user = self._generate_batch_prompt(readable)
+        # The default completion cap covers one summary; give the batch
+        # that much room per file so later files are not truncated
+        response = await self.ollama.generate(
+            client, system, user,
+            num_predict=OllamaClient.MODEL_OPTIONS["num_predict"] * len(readable))
+        if response:
+            parsed = self._split_batch_response(response, len(readable))
+            if parsed is not None:
+                summaries = iter(parsed)
+                for i, code in enumerate(contents):
+                    if code is not None:
+                        results[i] = next(summaries)
+                return results
+
+        # Batch call failed or did not parse; retry each file individually
+        return [
+            await self.process_file(client, file_path, relative_path)
+            for file_path, relative_path in batch
+        ]
+
+    # -- orchestration ------------------------------------------------------
+
+    async def _process_files(self, files: List[tuple[Path, str]],
+                             on_summary=None) -> List[Optional[str]]:
+        """Run batched summarization over all files with a bounded concurrent pool."""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        total_files = len(files)
+        batches = self._batch_files(files)
+
+        async with self.ollama.make_client() as client:
+            async def worker(start_index: int, batch: List[tuple[Path, str]]) -> List[Optional[str]]:
+                async with semaphore:
+                    for offset, (file_path, relative_path) in enumerate(batch):
+                        print(f"{Fore.YELLOW}Processing ({start_index + offset}/{total_files}): {relative_path}{Style.RESET_ALL}")
+                    results = await self._process_batch(client, batch)
+
+                formatted = []
+                for (file_path, relative_path), summary in zip(batch, results):
+                    if summary:
+                        summary = self.format_summary(relative_path, summary)
+                        if on_summary:
+                            on_summary(relative_path, summary)
+                    formatted.append(summary)
+                return formatted
+
+            tasks = []
+            start_index = 1
+            for batch in batches:
+                tasks.append(worker(start_index, batch))
+                start_index += len(batch)
+
+            # gather preserves input order, so results line up with files
+            nested = await asyncio.gather(*tasks)
+
+        return [result for batch_results in nested for result in batch_results]
+
+    def process_files(self, files: List[tuple[Path, str]],
+                      on_summary=None) -> tuple[List[tuple[str, str]], Dict]:
+        """Process an explicit list of (absolute path, relative path) pairs.
+
+        on_summary, when given, is called with (relative_path, summary) as
+        each summary completes, enabling streamed output.
+        """
+        total_files = len(files)
+
+        # Identical contents hit the model once; duplicates reuse the summary
+        unique_files, assignments = file_reader.deduplicate(files)
+        duplicates = total_files - len(unique_files)
+        if duplicates:
+            print(f"{Fore.CYAN}{duplicates} duplicate files will reuse summaries{Style.RESET_ALL}")
+
+        results = asyncio.run(self._process_files(unique_files, on_summary))
+
+        summaries = []
+        failed_files = []
+
+        for (file_path, relative_path), (unique_index, canonical) in zip(files, assignments):
+            summary = results[unique_index]
+            if summary:
+                if canonical is not None:
+                    summary = self.format_duplicate(relative_path, canonical, summary)
+                    if on_summary:
+                        on_summary(relative_path, summary)
+                summaries.append((relative_path, summary))
+            else:
+                failed_files.append(relative_path)
+
+        stats = {
+            'total': total_files,
+            'success': len(summaries),
+            'skipped': 0,
+            'failed': len(failed_files),
+            'duplicates': duplicates,
+            'cache_hits': self.cache.hits,
+            'cache_misses': self.cache.misses
+        }
+
+        return summaries, stats
+
+    def process_directory(self, directory_path: Path) -> tuple[List[tuple[str, str]], Dict]:
+        """Process all code files in a directory and its subdirectories."""
+        # One walk collects the list; the progress total is a byproduct,
+        # not a second traversal
+        files = list(self._iter_code_files(directory_path))
+
+        print(f"{Fore.CYAN}Found {len(files)} code files to process{Style.RESET_ALL}")
+
+        return self.process_files(files)
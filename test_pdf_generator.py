@@ -0,0 +1,23 @@
+import pytest
+
+SUMMARIES = [
+    ("a.py", "1. Overall Purpose: demo module\n\nUses **bold**, *italic*, and `code`."),
+    ("sub/b.js", "1. Overall Purpose: another file\n\n- first point\n- second point"),
+]
+STATS = {'total': 2, 'success': 2, 'skipped': 0, 'failed': 0}
+
+def _build_report(backend, tmp_path):
+    from pdf_generator import PDFGenerator
+    output_path = tmp_path / "report.pdf"
+    PDFGenerator(backend=backend).create_pdf_summary(
+        SUMMARIES, output_path, "demo", STATS)
+    assert output_path.read_bytes().startswith(b"%PDF-")
+
+def test_fpdf_backend_builds_pdf(tmp_path):
+    pytest.importorskip("reportlab")  # pdf_generator imports it at module level
+    pytest.importorskip("fpdf")
+    _build_report('fpdf', tmp_path)
+
+def test_reportlab_backend_builds_pdf(tmp_path):
+    pytest.importorskip("reportlab")
+    _build_report('reportlab', tmp_path)